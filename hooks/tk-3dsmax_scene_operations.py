@@ -8,10 +8,14 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
+import itertools
+import operator
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import sgtk
 from sgtk import TankError
-from typing import Any, Generator
 
 try:
     import pymxs
@@ -20,6 +24,42 @@ except ImportError:
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# Translation table to normalize the paths passed to 3ds Max on update (use forward
+# slashes). Scanned paths keep the native separators, so that they match publish paths.
+_SLASH_TABLE = str.maketrans("\\", "/")
+
+# The material map slots which may hold bitmap textures, and a getter reading them all
+# in a single call
+_MAP_SLOT_NAMES = ("diffuseMap", "bumpMap", "specularMap", "opacityMap", "reflectionMap")
+_MAP_SLOTS = operator.attrgetter(*_MAP_SLOT_NAMES)
+
+
+def _stat_file(file_path):
+    """
+    Get the status of a file on disk.
+
+    :param file_path: The file path to get the status for
+    :return: The file status or None if the file could not be accessed
+    :rtype: os.stat_result or None
+    """
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+def _is_same_path(path, other_path):
+    """
+    Check if two file paths point to the same file, ignoring separator and case
+    differences.
+
+    :param path: The first file path
+    :param other_path: The second file path
+    :rtype: bool
+    """
+    return os.path.normcase(os.path.normpath(path)) == os.path.normcase(
+        os.path.normpath(other_path)
+    )
 
 
 class BreakdownSceneOperations(HookBaseClass):
@@ -40,6 +80,9 @@ class BreakdownSceneOperations(HookBaseClass):
         # Store reference to pymxs runtime for convenience
         self._rt = pymxs.runtime
 
+        # Per-scan cache of file status, keyed by file path
+        self._stat_cache = {}
+
     def scan_scene(self):
         """
         The scan scene method is executed once at startup and its purpose is
@@ -63,183 +106,262 @@ class BreakdownSceneOperations(HookBaseClass):
         available. Any such versions are then displayed in the UI as out of date.
         """
 
-        refs = []
+        # The same file is often referenced many times in a scene (e.g. textures shared
+        # between materials), so only access it on disk once per scan
+        self._stat_cache = {}
 
-        # Scan XRef Objects
-        refs.extend(self._scan_xref_objects())
+        try:
+            # The scanners are generators: consume them while scene updates are suspended.
+            # The result needs to be a list since the app iterates over it several times.
+            scanners = (
+                self._scan_xref_objects,
+                self._scan_xref_scenes,
+                self._scan_material_bitmaps,
+            )
+            with self._scene_updates_suspended():
+                refs = list(
+                    itertools.chain.from_iterable(scan() for scan in scanners)
+                )
+
+            # Get the status of all the referenced files at once, and drop the references
+            # to missing files
+            self._stat_files(ref["path"] for ref in refs)
+            existing_refs = [
+                ref for ref in refs if self._stat_cache[ref["path"]] is not None
+            ]
+        finally:
+            # Don't keep the results around, files may change on disk between scans
+            self._stat_cache.clear()
+
+        return existing_refs
+
+    @contextmanager
+    def _scene_updates_suspended(self):
+        """
+        Context manager suspending viewport redraws, command panel updates and undo
+        recording, so that accessing many scene objects doesn't trigger needless
+        scene refreshes.
+        """
+        self._rt.disableSceneRedraw()
+        self._rt.suspendEditing()
+        try:
+            with pymxs.undo(False):
+                yield
+        finally:
+            self._rt.resumeEditing()
+            self._rt.enableSceneRedraw()
 
-        # Scan XRef Scenes
-        refs.extend(self._scan_xref_scenes())
+    def _stat_files(self, file_paths):
+        """
+        Get the status of the given files on disk and store the results in the file
+        status cache of the current scan. Missing files are stored as None.
 
-        # Scan Material Bitmap Textures
-        refs.extend(self._scan_material_bitmaps())
+        Accessing files is I/O bound (especially for files on network shares), so
+        the files are accessed from a pool of threads. This must not call into pymxs,
+        which is only safe to use from the main thread.
 
-        return refs
+        :param file_paths: The file paths to get the status for
+        :type file_paths: Iterable[str]
+        """
+        file_paths = [
+            path for path in set(file_paths) if path not in self._stat_cache
+        ]
+        if not file_paths:
+            return
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self._stat_cache.update(
+                zip(file_paths, executor.map(_stat_file, file_paths))
+            )
+
+    def _bulk_query(self, maxscript_expr):
+        """
+        Evaluate a MAXScript expression collecting data for many scene objects at once.
+
+        Each pymxs attribute access crosses into the MAXScript runtime, so gathering
+        all the needed values in a single MAXScript call is much cheaper than reading
+        them object per object from Python.
+
+        :param maxscript_expr: A MAXScript expression returning an array of arrays
+        :return: Generator of the collected records, one tuple of values per scene object
+        :rtype: Generator[tuple]
+        """
+        result = self._rt.execute(maxscript_expr)
+        if result:
+            for record in result:
+                yield tuple(record)
 
     def _get_xref_objects(self):
+        """
+        Get the XRef object records in the scene.
 
-        for object_name in self._rt.getMAXFileObjectNames(self._rt.Name("XRefObjects")):
-            obj = self._rt.getMAXFileObject(self._rt.Name("XRefObjects"), xref_name)
+        :return: Generator of (name, file path) tuples
+        :rtype: Generator[tuple]
+        """
+        return self._bulk_query(
+            "for i = 1 to objXRefMgr.recordCount collect "
+            "(local r = objXRefMgr.GetRecord i; #(r.name, r.srcFileName))"
+        )
+
+    def _get_xref_scenes(self):
+        """
+        Get the XRef scenes in the scene.
+
+        :return: Generator of (name, file path) tuples
+        :rtype: Generator[tuple]
+        """
+        return self._bulk_query(
+            "for i = 1 to xrefs.getXRefFileCount() collect "
+            "(local x = xrefs.getXRefFile i; #(getFilenameFile x.filename, x.filename))"
+        )
+
+    def _get_bitmaps(self):
+        """
+        Get the bitmap textures with a file name in the scene.
+
+        :return: Generator of (name, file path, handle) tuples
+        :rtype: Generator[tuple]
+        """
+        return self._bulk_query(
+            "for b in getClassInstances BitmapTexture "
+            "where b.filename != undefined and b.filename != \"\" "
+            "collect #(b.name, b.filename, b.handle)"
+        )
 
     def _scan_xref_objects(self):
         """
         Scan for XRef objects in the scene.
         
-        :return: List of XRef object references
-        :rtype: list
+        :return: Generator of XRef object references, not checked for existence on disk
+        :rtype: Generator[dict]
         """
-        refs = []
-
         try:
-            # Get all XRef objects in the scene
-            xref_objects = self._rt.getMAXFileObjectNames(self._rt.Name("XRefObjects"))
-            
-            if xref_objects:
-                for i in range(xref_objects.count):
-                    xref_name = str(xref_objects[i])
-                    
-                    # Get the XRef object
-                    xref_obj = self._rt.getMAXFileObject(self._rt.Name("XRefObjects"), xref_name)
-                    
-                    if xref_obj and hasattr(xref_obj, 'filename'):
-                        file_path = str(xref_obj.filename)
-                        if file_path and os.path.exists(file_path):
-                            refs.append({
-                                "node_name": xref_name,
-                                "node_type": "xref_object",
-                                "path": os.path.normpath(file_path),
-                                "extra_data": {
-                                    "xref_index": i
-                                }
-                            })
+            for i, (xref_name, file_path) in enumerate(self._get_xref_objects()):
+                file_path = str(file_path or "")
+                if file_path:
+                    yield {
+                        "node_name": str(xref_name),
+                        "node_type": "xref_object",
+                        "path": os.path.normpath(file_path),
+                        "extra_data": {
+                            "xref_index": i
+                        }
+                    }
         except Exception as e:
-            self.logger.warning("Error scanning XRef objects: %s" % str(e))
-            
-        return refs
+            self.logger.warning("Error scanning XRef objects: %s", e)
 
     def _scan_xref_scenes(self):
         """
         Scan for XRef scenes in the scene.
         
-        :return: List of XRef scene references
-        :rtype: list
+        :return: Generator of XRef scene references, not checked for existence on disk
+        :rtype: Generator[dict]
         """
-        refs = []
-        
         try:
-            # Get all XRef scenes
-            xref_scenes = self._rt.getMAXFileObjectNames(self._rt.Name("XRefScenes"))
-            
-            if xref_scenes:
-                for i in range(xref_scenes.count):
-                    xref_name = str(xref_scenes[i])
-                    
-                    # Get the XRef scene
-                    xref_scene = self._rt.getMAXFileObject(self._rt.Name("XRefScenes"), xref_name)
-                    
-                    if xref_scene and hasattr(xref_scene, 'filename'):
-                        file_path = str(xref_scene.filename)
-                        if file_path and os.path.exists(file_path):
-                            refs.append({
-                                "node_name": xref_name,
-                                "node_type": "xref_scene",
-                                "path": os.path.normpath(file_path),
-                                "extra_data": {
-                                    "xref_index": i
-                                }
-                            })
+            for i, (xref_name, file_path) in enumerate(self._get_xref_scenes()):
+                file_path = str(file_path or "")
+                if file_path:
+                    yield {
+                        # The file name alone is not unique, add the XRef number
+                        "node_name": "%s_%d" % (xref_name, i + 1),
+                        "node_type": "xref_scene",
+                        "path": os.path.normpath(file_path),
+                        "extra_data": {
+                            "xref_index": i
+                        }
+                    }
         except Exception as e:
-            self.logger.warning("Error scanning XRef scenes: %s" % str(e))
-            
-        return refs
+            self.logger.warning("Error scanning XRef scenes: %s", e)
 
     def _scan_material_bitmaps(self):
         """
         Scan for bitmap textures in materials.
         
-        :return: List of bitmap texture references
-        :rtype: list
+        :return: Generator of bitmap texture references, not checked for existence on disk
+        :rtype: Generator[dict]
         """
-        refs = []
-        
         try:
-            # Get all bitmap textures in the scene
-            bitmap_textures = self._rt.getClassInstances(self._rt.BitmapTexture)
-            
-            for bitmap in bitmap_textures:
-                if hasattr(bitmap, 'filename') and bitmap.filename:
-                    file_path = str(bitmap.filename)
-                    if file_path and os.path.exists(file_path):
-                        # Get the material name that contains this bitmap
-                        material_name = self._get_material_name_for_bitmap(bitmap)
-                        node_name = "%s_bitmap_%s" % (material_name or "unknown", bitmap.name or "unnamed")
-                        
-                        refs.append({
-                            "node_name": node_name,
-                            "node_type": "bitmap_texture",
-                            "path": os.path.normpath(file_path),
-                            "extra_data": {
-                                "bitmap_handle": bitmap.handle,
-                                "material_name": material_name
-                            }
-                        })
+            # Find the material of every bitmap at once rather than for each bitmap
+            bitmap_to_material = self._get_bitmap_material_index()
+
+            for bitmap_name, file_path, bitmap_handle in self._get_bitmaps():
+                file_path = str(file_path or "")
+                if file_path:
+                    # Get the material name that contains this bitmap. The index only
+                    # covers the standard map slots, bitmaps found elsewhere (e.g. nested
+                    # in other texture maps) are still listed, with an unknown material.
+                    material_name = bitmap_to_material.get(bitmap_handle)
+                    node_name = "%s_bitmap_%s" % (material_name or "unknown", bitmap_name or "unnamed")
+                    
+                    yield {
+                        "node_name": node_name,
+                        "node_type": "bitmap_texture",
+                        "path": os.path.normpath(file_path),
+                        "extra_data": {
+                            "bitmap_handle": bitmap_handle,
+                            "material_name": material_name
+                        }
+                    }
         except Exception as e:
-            self.logger.warning("Error scanning bitmap textures: %s" % str(e))
-            
-        return refs
+            self.logger.warning("Error scanning bitmap textures: %s", e)
 
-    def _get_material_name_for_bitmap(self, bitmap):
+    def _get_bitmap_material_index(self):
         """
-        Get the material name that contains the given bitmap texture.
-        
-        :param bitmap: The bitmap texture object
-        :return: Material name or None if not found
-        :rtype: str or None
+        Build a lookup of the scene materials using each bitmap texture.
+
+        The scene materials are walked once, so that finding the material of a bitmap
+        doesn't require searching all the materials again for every bitmap.
+
+        :return: Mapping of bitmap handles to the name of the first scene material
+            using the bitmap
+        :rtype: dict
         """
+        bitmap_to_material = {}
+
         try:
-            # Get all materials in the scene
-            materials = self._rt.sceneMaterials
-            
-            for material in materials:
-                if self._bitmap_in_material(bitmap, material):
-                    return str(material.name) if hasattr(material, 'name') else None
+            for material in self._rt.sceneMaterials:
+                material_name = str(material.name) if hasattr(material, 'name') else None
+                self._index_material_bitmaps(material, material_name, bitmap_to_material)
         except Exception as e:
-            self.logger.debug("Error finding material for bitmap: %s" % str(e))
-            
-        return None
+            self.logger.debug("Error indexing material bitmaps: %s", e)
 
-    def _bitmap_in_material(self, bitmap, material):
+        return bitmap_to_material
+
+    def _index_material_bitmaps(self, material, material_name, bitmap_to_material):
         """
-        Check if a bitmap is used in a material (recursive check for sub-materials).
-        
-        :param bitmap: The bitmap texture to search for
-        :param material: The material to search in
-        :return: True if bitmap is found in material
-        :rtype: bool
+        Add the bitmaps used by a material and its sub-materials to the bitmap
+        material index.
+
+        :param material: The material to index
+        :param material_name: The name of the scene material the bitmaps belong to
+        :param bitmap_to_material: The index to populate, mapping bitmap handles
+            to material names
         """
-        try:
-            # Check if this material directly uses the bitmap
-            if hasattr(material, 'diffuseMap') and material.diffuseMap == bitmap:
-                return True
-            if hasattr(material, 'bumpMap') and material.bumpMap == bitmap:
-                return True
-            if hasattr(material, 'specularMap') and material.specularMap == bitmap:
-                return True
-            if hasattr(material, 'opacityMap') and material.opacityMap == bitmap:
-                return True
-            if hasattr(material, 'reflectionMap') and material.reflectionMap == bitmap:
-                return True
-            
-            # Check sub-materials for multi-materials
-            if hasattr(material, 'materialList'):
-                for sub_material in material.materialList:
-                    if sub_material and self._bitmap_in_material(bitmap, sub_material):
-                        return True
-                        
-        except Exception as e:
-            self.logger.debug("Error checking bitmap in material: %s" % str(e))
-            
-        return False
+        # Walk the material tree with a stack rather than recursing for each
+        # sub-material (multi-materials)
+        stack = [material]
+        while stack:
+            current = stack.pop()
+            try:
+                # Index the bitmaps this material directly uses
+                try:
+                    maps = _MAP_SLOTS(current)
+                except AttributeError:
+                    # Not all material types have all the slots, read them one by one
+                    maps = [getattr(current, slot, None) for slot in _MAP_SLOT_NAMES]
+
+                for bitmap in maps:
+                    if bitmap is not None:
+                        bitmap_handle = getattr(bitmap, "handle", None)
+                        if bitmap_handle is not None:
+                            bitmap_to_material.setdefault(bitmap_handle, material_name)
+
+                sub_materials = getattr(current, "materialList", None)
+                if sub_materials:
+                    stack.extend(m for m in sub_materials if m is not None)
+
+            except Exception as e:
+                self.logger.debug("Error indexing bitmaps in material: %s", e)
 
     def update(self, item):
         """
@@ -250,117 +372,188 @@ class BreakdownSceneOperations(HookBaseClass):
 
         :param item: Dictionary on the same form as was generated by the scan_scene hook above.
                      The path key now holds the path that the node should be updated *to* rather than the current path.
+
+        :return: True if the item was updated, else False.
+        :rtype: bool
         """
 
-        node_name = item["node_name"]
-        node_type = item["node_type"]
-        path = item["path"]
-        extra_data = item.get("extra_data", {})
+        return bool(self.update_items([item]))
+
+    def update_items(self, items):
+        """
+        Perform replacements for a number of scene items at once.
 
-        # Normalize path for 3ds Max (use forward slashes)
-        path = path.replace("\\", "/")
+        Animation recording and scene redraws are disabled for the whole update,
+        instead of once per item.
 
-        if node_type == "xref_object":
-            self._update_xref_object(node_name, path, extra_data)
-        elif node_type == "xref_scene":
-            self._update_xref_scene(node_name, path, extra_data)
-        elif node_type == "bitmap_texture":
-            self._update_bitmap_texture(node_name, path, extra_data)
-        else:
-            self.logger.warning("Unknown node type: %s" % node_type)
+        :param items: List of dictionaries on the same form as was generated by the scan_scene
+                      hook above. The path key now holds the path that the node should be
+                      updated *to* rather than the current path.
+        :type items: List[dict]
 
-    def _update_xref_object(self, node_name, path, extra_data):
+        :return: The items that were updated.
+        :rtype: List[dict]
         """
-        Update an XRef object to point to a new file.
-        
-        :param node_name: Name of the XRef object
-        :param path: New file path
-        :param extra_data: Extra data containing xref_index
+
+        # Group the items by node type, to update all items of the same type together
+        items_by_type = {}
+        for item in items:
+            items_by_type.setdefault(item["node_type"], []).append(item)
+
+        for node_type in items_by_type:
+            if node_type not in ("xref_object", "xref_scene", "bitmap_texture"):
+                self.logger.warning("Unknown node type: %s", node_type)
+
+        # The MAXScript accessors passed to the update methods below are resolved once
+        # for the whole batch, rather than for every item
+        updated_items = []
+        with pymxs.animate(False):
+            self._rt.disableSceneRedraw()
+            try:
+                updated_items.extend(
+                    self._update_xrefs(
+                        items_by_type.get("xref_object", []),
+                        self._rt.objXRefMgr.GetRecord,
+                        "srcFileName",
+                        lambda record: record.Update(),
+                        "XRef object",
+                    )
+                )
+                updated_items.extend(
+                    self._update_xrefs(
+                        items_by_type.get("xref_scene", []),
+                        self._rt.xrefs.getXRefFile,
+                        "filename",
+                        self._rt.updateXRef,
+                        "XRef scene",
+                    )
+                )
+                updated_items.extend(
+                    self._update_bitmap_textures(items_by_type.get("bitmap_texture", []))
+                )
+            finally:
+                self._rt.enableSceneRedraw()
+
+        return updated_items
+
+    def _update_xrefs(self, items, get_xref, path_attr, reload_xref, label):
         """
-        try:
-            self.logger.debug("Updating XRef object '%s' to: %s" % (node_name, path))
-            
-            xref_index = extra_data.get("xref_index", 0)
-            
-            # Get the XRef object
-            xref_obj = self._rt.getMAXFileObject(self._rt.Name("XRefObjects"), node_name)
-            
-            if xref_obj:
-                # Update the filename
-                xref_obj.filename = path
-                
-                # Reload the XRef
-                self._rt.reloadMAXFile(self._rt.Name("XRefObjects"), node_name)
-                
-                self.logger.debug("Successfully updated XRef object '%s'" % node_name)
-            else:
-                self.logger.error("Could not find XRef object '%s'" % node_name)
-                
-        except Exception as e:
-            self.logger.error("Error updating XRef object '%s': %s" % (node_name, str(e)))
+        Update XRefs to point to new files.
+
+        The XRefs are found by the index they were scanned with, through the same
+        MAXScript interface as the scan.
 
-    def _update_xref_scene(self, node_name, path, extra_data):
+        :param items: The XRef items to update, with extra data containing the xref_index
+        :param get_xref: Function returning the XRef for a (1-based) MAXScript index
+        :param path_attr: The name of the XRef attribute holding its file path
+        :param reload_xref: Function reloading an XRef from its file
+        :param label: Human readable XRef type, used for logging
+
+        :return: The items that were updated.
+        :rtype: List[dict]
         """
-        Update an XRef scene to point to a new file.
-        
-        :param node_name: Name of the XRef scene
-        :param path: New file path
-        :param extra_data: Extra data containing xref_index
+        updated_items = []
+
+        for item in items:
+            node_name = item["node_name"]
+            # Normalize path for 3ds Max (use forward slashes)
+            path = item["path"].translate(_SLASH_TABLE)
+            extra_data = item.get("extra_data") or {}
+
+            try:
+                self.logger.debug("Updating %s '%s' to: %s", label, node_name, path)
+
+                xref_index = extra_data.get("xref_index")
+                if xref_index is None:
+                    self.logger.error("No XRef index provided for '%s'", node_name)
+                    continue
+
+                # The scanned index is 0-based, MAXScript indices are 1-based
+                xref = get_xref(xref_index + 1)
+                if not xref:
+                    self.logger.error("Could not find %s '%s'", label, node_name)
+                    continue
+
+                # Make sure the XRef at this index is still the one that was scanned
+                old_path = extra_data.get("old_path")
+                if old_path and not _is_same_path(str(getattr(xref, path_attr)), old_path):
+                    self.logger.error(
+                        "%s '%s' changed since the scene was scanned", label, node_name
+                    )
+                    continue
+
+                previous_path = getattr(xref, path_attr)
+                setattr(xref, path_attr, path)
+                try:
+                    reload_xref(xref)
+                except Exception:
+                    # Don't leave the XRef pointing to a file that was not loaded
+                    setattr(xref, path_attr, previous_path)
+                    raise
+
+                updated_items.append(item)
+                self.logger.debug("Successfully updated %s '%s'", label, node_name)
+
+            except Exception as e:
+                self.logger.error("Error updating %s '%s': %s", label, node_name, e)
+
+        return updated_items
+
+    def _update_bitmap_textures(self, items):
         """
-        try:
-            self.logger.debug("Updating XRef scene '%s' to: %s" % (node_name, path))
-            
-            xref_index = extra_data.get("xref_index", 0)
-            
-            # Get the XRef scene
-            xref_scene = self._rt.getMAXFileObject(self._rt.Name("XRefScenes"), node_name)
-            
-            if xref_scene:
-                # Update the filename
-                xref_scene.filename = path
-                
-                # Reload the XRef
-                self._rt.reloadMAXFile(self._rt.Name("XRefScenes"), node_name)
-                
-                self.logger.debug("Successfully updated XRef scene '%s'" % node_name)
-            else:
-                self.logger.error("Could not find XRef scene '%s'" % node_name)
-                
-        except Exception as e:
-            self.logger.error("Error updating XRef scene '%s': %s" % (node_name, str(e)))
+        Update bitmap textures to point to new files.
 
-    def _update_bitmap_texture(self, node_name, path, extra_data):
-        """
-        Update a bitmap texture to point to a new file.
-        
-        :param node_name: Name identifier for the bitmap
-        :param path: New file path
-        :param extra_data: Extra data containing bitmap_handle
+        :param items: The bitmap texture items to update, with extra data containing
+            the bitmap_handle
+
+        :return: The items that were updated.
+        :rtype: List[dict]
         """
-        try:
-            self.logger.debug("Updating bitmap texture '%s' to: %s" % (node_name, path))
-            
-            bitmap_handle = extra_data.get("bitmap_handle")
-            
-            if bitmap_handle:
-                # Get the bitmap by handle
-                bitmap = self._rt.maxOps.getNodeByHandle(bitmap_handle)
-                
-                if bitmap:
-                    # Update the filename
-                    bitmap.filename = path
-                    
-                    # Reload the bitmap
-                    bitmap.reload()
-                    
-                    self.logger.debug("Successfully updated bitmap texture '%s'" % node_name)
+        updated_items = []
+
+        # Resolve the MAXScript function once for the whole batch, rather than for
+        # every item
+        get_by_handle = self._rt.maxOps.getNodeByHandle
+
+        for item in items:
+            node_name = item["node_name"]
+            # Normalize path for 3ds Max (use forward slashes)
+            path = item["path"].translate(_SLASH_TABLE)
+            extra_data = item.get("extra_data") or {}
+
+            try:
+                self.logger.debug("Updating bitmap texture '%s' to: %s", node_name, path)
+
+                bitmap_handle = extra_data.get("bitmap_handle")
+
+                if bitmap_handle:
+                    # Get the bitmap by handle
+                    bitmap = get_by_handle(bitmap_handle)
+
+                    if bitmap:
+                        # Update the filename
+                        previous_path = bitmap.filename
+                        bitmap.filename = path
+
+                        # Reload the bitmap
+                        try:
+                            bitmap.reload()
+                        except Exception:
+                            # Don't leave the bitmap pointing to a file that was not loaded
+                            bitmap.filename = previous_path
+                            raise
+
+                        updated_items.append(item)
+                        self.logger.debug("Successfully updated bitmap texture '%s'", node_name)
+                    else:
+                        self.logger.error("Could not find bitmap texture with handle '%s'", bitmap_handle)
                 else:
-                    self.logger.error("Could not find bitmap texture with handle '%s'" % bitmap_handle)
-            else:
-                self.logger.error("No bitmap handle provided for '%s'" % node_name)
-                
-        except Exception as e:
-            self.logger.error("Error updating bitmap texture '%s': %s" % (node_name, str(e)))
+                    self.logger.error("No bitmap handle provided for '%s'", node_name)
+
+            except Exception as e:
+                self.logger.error("Error updating bitmap texture '%s': %s", node_name, e)
+
+        return updated_items
 
     def register_scene_change_callback(self, scene_change_callback):
         """
@@ -385,7 +578,7 @@ class BreakdownSceneOperations(HookBaseClass):
             self._scene_change_callback = scene_change_callback
             
         except Exception as e:
-            self.logger.error("Error registering scene change callback: %s" % str(e))
+            self.logger.error("Error registering scene change callback: %s", e)
 
     def unregister_scene_change_callback(self):
         """Unregister the scene change callbacks."""
@@ -398,4 +591,4 @@ class BreakdownSceneOperations(HookBaseClass):
             self.logger.debug("Scene change callback unregistered")
 
         except Exception as e:
-            self.logger.error("Error unregistering scene change callback: %s" % str(e))
+            self.logger.error("Error unregistering scene change callback: %s", e)
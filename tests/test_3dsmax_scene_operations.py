@@ -0,0 +1,314 @@
+# Copyright (c) 2021 Autodesk, Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk, Inc.
+
+import importlib.util
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import pytest
+import sgtk
+
+
+"""
+The purpose of the set of tests below is to validate the 3ds Max scene operations hook
+logic that does not depend on 3ds Max itself. The pymxs module is replaced by a mock,
+so that the hook can be loaded and executed outside of 3ds Max.
+"""
+
+HOOK_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "hooks", "tk-3dsmax_scene_operations.py"
+    )
+)
+
+
+@pytest.fixture
+def pymxs():
+    """
+    Return a mock of the pymxs module.
+    """
+
+    return MagicMock()
+
+
+@pytest.fixture
+def hook(pymxs):
+    """
+    Return an instance of the 3ds Max scene operations hook, using the mock pymxs module.
+    """
+
+    with patch.dict(sys.modules, {"pymxs": pymxs}), patch(
+        "sgtk.get_hook_baseclass", return_value=sgtk.Hook
+    ):
+        spec = importlib.util.spec_from_file_location(
+            "tk_3dsmax_scene_operations", HOOK_PATH
+        )
+        hook_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(hook_module)
+
+    hook_class = hook_module.BreakdownSceneOperations
+    hook_class.logger = MagicMock()
+    return hook_class(MagicMock())
+
+
+def mock_scene(pymxs, xref_objects=(), xref_scenes=(), bitmaps=(), materials=()):
+    """
+    Set up the mock pymxs runtime to return the given scene data.
+    """
+
+    def execute(maxscript_expr):
+        if "objXRefMgr" in maxscript_expr:
+            return [list(r) for r in xref_objects]
+        if "xrefs.getXRefFile" in maxscript_expr:
+            return [list(r) for r in xref_scenes]
+        if "BitmapTexture" in maxscript_expr:
+            return [list(r) for r in bitmaps]
+        return []
+
+    pymxs.runtime.execute.side_effect = execute
+    pymxs.runtime.sceneMaterials = list(materials)
+
+
+def test_scan_scene(hook, pymxs, tmp_path):
+    """
+    Test that the scan returns the references of all types, with native paths.
+    """
+
+    obj_path = tmp_path / "object.max"
+    scene_path = tmp_path / "scene.max"
+    texture_path = tmp_path / "texture.png"
+    for path in (obj_path, scene_path, texture_path):
+        path.write_text("")
+
+    mock_scene(
+        pymxs,
+        xref_objects=[("Box001", obj_path.as_posix())],
+        xref_scenes=[("scene", scene_path.as_posix())],
+        bitmaps=[("Map #1", texture_path.as_posix(), 7)],
+        materials=[
+            SimpleNamespace(
+                name="Material #1",
+                diffuseMap=SimpleNamespace(handle=7),
+                materialList=None,
+            )
+        ],
+    )
+
+    refs = hook.scan_scene()
+
+    assert isinstance(refs, list)
+    assert refs == [
+        {
+            "node_name": "Box001",
+            "node_type": "xref_object",
+            "path": os.path.normpath(str(obj_path)),
+            "extra_data": {"xref_index": 0},
+        },
+        {
+            "node_name": "scene_1",
+            "node_type": "xref_scene",
+            "path": os.path.normpath(str(scene_path)),
+            "extra_data": {"xref_index": 0},
+        },
+        {
+            "node_name": "Material #1_bitmap_Map #1",
+            "node_type": "bitmap_texture",
+            "path": os.path.normpath(str(texture_path)),
+            "extra_data": {"bitmap_handle": 7, "material_name": "Material #1"},
+        },
+    ]
+
+    # Scene updates are restored after the scan
+    pymxs.runtime.enableSceneRedraw.assert_called_once()
+    pymxs.runtime.resumeEditing.assert_called_once()
+
+
+def test_scan_scene_missing_files(hook, pymxs, tmp_path):
+    """
+    Test that the scan drops the references to files that do not exist on disk.
+    """
+
+    existing_path = tmp_path / "texture.png"
+    existing_path.write_text("")
+    missing_path = tmp_path / "missing.png"
+
+    mock_scene(
+        pymxs,
+        xref_objects=[("Box001", missing_path.as_posix())],
+        xref_scenes=[("missing", missing_path.as_posix())],
+        bitmaps=[
+            ("Map #1", missing_path.as_posix(), 1),
+            ("Map #2", existing_path.as_posix(), 2),
+            ("Map #3", missing_path.as_posix(), 3),
+        ],
+    )
+
+    with patch("os.stat", wraps=os.stat) as stat_mock:
+        refs = hook.scan_scene()
+
+    assert [ref["node_name"] for ref in refs] == ["unknown_bitmap_Map #2"]
+    assert refs[0]["path"] == os.path.normpath(str(existing_path))
+
+    # Each file is only accessed once, even if it is referenced several times
+    stat_paths = [call.args[0] for call in stat_mock.call_args_list]
+    assert sorted(stat_paths) == sorted(
+        {os.path.normpath(str(existing_path)), os.path.normpath(str(missing_path))}
+    )
+
+
+def test_scan_scene_material_index(hook, pymxs, tmp_path):
+    """
+    Test that bitmaps are matched to the top level scene material using them, and
+    that bitmaps not found in any material are still listed.
+    """
+
+    texture_path = tmp_path / "texture.png"
+    texture_path.write_text("")
+
+    # A multi-material, which sub-material does not have all the map slots
+    sub_material = SimpleNamespace(bumpMap=SimpleNamespace(handle=2))
+    multi_material = SimpleNamespace(name="Multi", materialList=[None, sub_material])
+
+    mock_scene(
+        pymxs,
+        bitmaps=[
+            ("Map #1", texture_path.as_posix(), 1),
+            ("Map #2", texture_path.as_posix(), 2),
+        ],
+        materials=[multi_material],
+    )
+
+    refs = hook.scan_scene()
+
+    assert [ref["node_name"] for ref in refs] == [
+        "unknown_bitmap_Map #1",
+        "Multi_bitmap_Map #2",
+    ]
+    assert refs[0]["extra_data"]["material_name"] is None
+    assert refs[1]["extra_data"]["material_name"] == "Multi"
+
+
+def test_update_items(hook, pymxs):
+    """
+    Test that the items are updated according to their type, and that only the
+    updated items are returned.
+    """
+
+    record = SimpleNamespace(srcFileName="C:/old/object.max", Update=MagicMock())
+    xref_scene = SimpleNamespace(filename="C:/old/scene.max")
+    bitmap = SimpleNamespace(filename="C:/old/texture.png", reload=MagicMock())
+    pymxs.runtime.objXRefMgr.GetRecord.return_value = record
+    pymxs.runtime.xrefs.getXRefFile.return_value = xref_scene
+    pymxs.runtime.maxOps.getNodeByHandle.return_value = bitmap
+
+    items = [
+        {
+            "node_name": "Box001",
+            "node_type": "xref_object",
+            "path": "C:\\new\\object.max",
+            "extra_data": {"xref_index": 0, "old_path": "C:/old/object.max"},
+        },
+        {
+            "node_name": "scene_2",
+            "node_type": "xref_scene",
+            "path": "C:\\new\\scene.max",
+            "extra_data": {"xref_index": 1},
+        },
+        {
+            "node_name": "Material #1_bitmap_Map #1",
+            "node_type": "bitmap_texture",
+            "path": "C:\\new\\texture.png",
+            "extra_data": {"bitmap_handle": 7},
+        },
+        {
+            "node_name": "Something",
+            "node_type": "unknown",
+            "path": "C:\\new\\unknown",
+        },
+    ]
+
+    updated_items = hook.update_items(items)
+
+    assert updated_items == items[:3]
+
+    # XRefs are found by their 1-based MAXScript index
+    pymxs.runtime.objXRefMgr.GetRecord.assert_called_once_with(1)
+    pymxs.runtime.xrefs.getXRefFile.assert_called_once_with(2)
+    pymxs.runtime.maxOps.getNodeByHandle.assert_called_once_with(7)
+
+    # The paths are given to 3ds Max with forward slashes, and the files reloaded
+    assert record.srcFileName == "C:/new/object.max"
+    record.Update.assert_called_once()
+    assert xref_scene.filename == "C:/new/scene.max"
+    pymxs.runtime.updateXRef.assert_called_once_with(xref_scene)
+    assert bitmap.filename == "C:/new/texture.png"
+    bitmap.reload.assert_called_once()
+
+    hook.logger.warning.assert_called_once_with("Unknown node type: %s", "unknown")
+    pymxs.runtime.enableSceneRedraw.assert_called_once()
+
+
+def test_update_items_errors(hook, pymxs):
+    """
+    Test that the items failing to update are reported and not returned as updated.
+    """
+
+    record = SimpleNamespace(
+        srcFileName="C:/old/object.max",
+        Update=MagicMock(side_effect=RuntimeError("Could not load")),
+    )
+    xref_scene = SimpleNamespace(filename="C:/other/scene.max")
+    pymxs.runtime.objXRefMgr.GetRecord.return_value = record
+    pymxs.runtime.xrefs.getXRefFile.return_value = xref_scene
+    pymxs.runtime.maxOps.getNodeByHandle.return_value = None
+
+    items = [
+        # The reload fails
+        {
+            "node_name": "Box001",
+            "node_type": "xref_object",
+            "path": "C:/new/object.max",
+            "extra_data": {"xref_index": 0},
+        },
+        # The XRef at the scanned index is not the one that was scanned anymore
+        {
+            "node_name": "scene_1",
+            "node_type": "xref_scene",
+            "path": "C:/new/scene.max",
+            "extra_data": {"xref_index": 0, "old_path": "C:/old/scene.max"},
+        },
+        # No XRef index
+        {
+            "node_name": "scene_2",
+            "node_type": "xref_scene",
+            "path": "C:/new/scene.max",
+            "extra_data": None,
+        },
+        # The bitmap is not found
+        {
+            "node_name": "Material #1_bitmap_Map #1",
+            "node_type": "bitmap_texture",
+            "path": "C:/new/texture.png",
+            "extra_data": {"bitmap_handle": 7},
+        },
+    ]
+
+    assert hook.update_items(items) == []
+    assert hook.update(items[0]) is False
+
+    # The XRef which failed to reload is restored to its previous file
+    assert record.srcFileName == "C:/old/object.max"
+    assert xref_scene.filename == "C:/other/scene.max"
+    pymxs.runtime.updateXRef.assert_not_called()
+
+    assert hook.logger.error.call_count == 5
+    pymxs.runtime.enableSceneRedraw.assert_called()